@@ -2,4 +2,4 @@ from matryoshka import Matryoshka
 from status import Status
 from exception import MatryoshkaException
 from file_system import FileSystem
-from file import File
+from file import File, FoundFiles
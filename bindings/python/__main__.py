@@ -1,15 +1,16 @@
 import unittest
 from pathlib import Path
-import faulthandler
-from tempfile import TemporaryDirectory
 
 from matryoshka import Matryoshka
 from file_system import FileSystem
 from file import File
+from exception import MatryoshkaException
 
 
 class TestMatryoshka(unittest.TestCase):
     def setUp(self) -> None:
+        from tempfile import TemporaryDirectory
+
         dll_path = Matryoshka.find()
         if dll_path is None:
             raise ValueError(
@@ -52,6 +53,37 @@ class TestMatryoshka(unittest.TestCase):
 
         output_file.unlink()
 
+    def test_create_and_pull(self):
+        output_file = Path(self.temp_directory.name, "pulled_example_file")
+
+        with FileSystem(":memory:", self.matryoshka) as fs:
+            with File.create(fs, Path("folder1", "file"), self.example_file) as file:
+                file.pull(output_file)
+
+        with output_file.open("rb") as output:
+            self.assertEqual(output.read(), b"1234")
+
+        output_file.unlink()
+
+    def test_create_batch(self):
+        example_paths = [Path("folder1", "file"), Path("folder2", "file")]
+        with FileSystem(":memory:", self.matryoshka) as fs:
+            files = File.create_batch(
+                fs, [(path, self.example_file) for path in example_paths]
+            )
+            self.assertEqual(len(files), 2)
+            for file, example_path in zip(files, example_paths):
+                with file:
+                    self.assertEqual(file.size, 4)
+                    self.assertEqual(str(file), "/".join(example_path.parts))
+
+    def test_open_missing(self):
+        with FileSystem(":memory:", self.matryoshka) as fs:
+            file = File(fs, Path("folder1", "file"))
+            with self.assertRaises(MatryoshkaException):
+                file.__enter__()
+            self.assertFalse(file)
+
     def test_find(self):
         with FileSystem(":memory:", self.matryoshka) as fs:
             with File.create(fs, Path("folder1", "file"), self.example_file):
@@ -61,8 +93,13 @@ class TestMatryoshka(unittest.TestCase):
 
             files = File.find(fs, Path("folder*", "file"))
             self.assertEqual(len(files), 2)
+            self.assertEqual(
+                sorted(str(file) for file in files), ["folder1/file", "folder2/file"]
+            )
 
 
 if __name__ == "__main__":
+    import faulthandler
+
     faulthandler.enable()
     unittest.main()
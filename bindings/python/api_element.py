@@ -6,12 +6,42 @@ class ApiElement:
     An API element which may modify the shared library.
     """
 
+    __slots__ = ("matryoshka",)
+
+    # The library the class was initialized for most recently
+    _initialized_library = None
+
     def __init__(self, matryoshka: Matryoshka):
         if not matryoshka:
             raise ValueError("The shared library is not loaded!")
 
         self.matryoshka = matryoshka
-        self.initialize(self.matryoshka)
+        self._ensure_initialized(self.matryoshka)
+
+    @classmethod
+    def _ensure_initialized(cls, matryoshka: Matryoshka):
+        """
+        Run initialize only if the class was not yet initialized for this shared library.
+        :param matryoshka: The shared library.
+        """
+        if cls._initialized_library is not matryoshka.library:
+            cls.initialize(matryoshka)
+            cls._initialized_library = matryoshka.library
+
+    @staticmethod
+    def _declare(matryoshka: Matryoshka, name: str, restype, *argtypes):
+        """
+        Declare the prototype of a function in the shared library.
+        :param matryoshka: The shared library.
+        :param name: The name of the function.
+        :param restype: The return type of the function or None for void.
+        :param argtypes: The types of the arguments.
+        :return: The configured function.
+        """
+        function = getattr(matryoshka.library, name)
+        function.restype = restype
+        function.argtypes = argtypes
+        return function
 
     @classmethod
     def initialize(cls, matryoshka: Matryoshka):
@@ -1,3 +1,4 @@
+from matryoshka import Matryoshka
 from status import Status
 
 
@@ -8,3 +9,16 @@ class MatryoshkaException(Exception):
 
     def __init__(self, status: Status):
         super().__init__(str(status))
+
+    @classmethod
+    def from_handle(
+        cls, matryoshka: Matryoshka, handle: Status.HANDLE_TYPE
+    ) -> "MatryoshkaException":
+        """
+        Create the exception from a raw status handle reported by the shared library.
+        :param matryoshka: The shared library.
+        :param handle: The handle of the status. It is released afterwards.
+        :return: The exception.
+        """
+        with Status(matryoshka, handle) as status:
+            return cls(status)
@@ -1,6 +1,7 @@
 import ctypes
-from pathlib import Path
-from typing import Sequence, Optional
+import os
+from pathlib import Path, PurePath
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
 from matryoshka import Matryoshka
 from status import Status
@@ -14,175 +15,311 @@ class File(ApiElement):
     A single file stored in the virtual file system.
     """
 
+    __slots__ = ("path", "file_system", "handle", "_is_open", "_path_bytes", "_size")
+
     class FileHandle(ctypes.Structure):
         pass
 
     # The underlying type of handle
     HANDLE_TYPE = ctypes.POINTER(FileHandle)
 
-    # The type of callback used for extracting found paths.
-    FIND_CALLBACK = ctypes.CFUNCTYPE(None, ctypes.c_char_p)
+    # The types accepted as paths in the virtual or the real file system
+    VIRTUAL_PATH_TYPE = Union[str, PurePath]
+    REAL_PATH_TYPE = Union[str, bytes, os.PathLike]
 
     @classmethod
     def create(
         cls,
         file_system: FileSystem,
-        virtual_path: Path,
-        real_path: Path,
+        virtual_path: VIRTUAL_PATH_TYPE,
+        real_path: REAL_PATH_TYPE,
         chunk_size: int = -1,
     ) -> "File":
         """
         Create a new file in the virtual file system.
         :param file_system: The file system.
-        :param virtual_path: The path in the virtual file system.
+        :param virtual_path: The path in the virtual file system. Strings need forward slashes as separators.
         :param real_path: The path of the real file on disk.
         :param chunk_size: The size of a chunk. Values < 0 will let the algorithm choose.
-        :return: A opened file. Needs to be wrapped in a context manager!
+        :return: A opened file. Needs to be wrapped in a context manager! It may be used directly without reopening.
         """
 
-        with Status(file_system.matryoshka) as status:
-            file_system.matryoshka.library.Push.restype = File.HANDLE_TYPE
-            file_system.matryoshka.library.Push.argtypes = (
-                FileSystem.HANDLE_TYPE,
-                ctypes.c_char_p,
-                ctypes.c_char_p,
-                ctypes.c_int,
-                ctypes.POINTER(Status.HANDLE_TYPE),
-            )
+        file = File(file_system, virtual_path)
+        status_handle = Status.HANDLE_TYPE()
+        file_handle = File._push(
+            file_system.handle,
+            file._path_bytes,
+            File._encode_real_path(real_path),
+            chunk_size,
+            ctypes.byref(status_handle),
+        )
+        if not file_handle:
+            raise MatryoshkaException.from_handle(file_system.matryoshka, status_handle)
 
-            file_handle = file_system.matryoshka.library.Push(
-                file_system.handle,
-                "/".join(virtual_path.parts).encode("ascii"),
-                str(real_path.absolute()).encode("ascii"),
-                chunk_size,
-                ctypes.byref(status.handle),
-            )
+        file.handle = file_handle
+        file._is_open = True
+        return file
+
+    @classmethod
+    def create_batch(
+        cls,
+        file_system: FileSystem,
+        paths: Iterable[Tuple[VIRTUAL_PATH_TYPE, REAL_PATH_TYPE]],
+        chunk_size: int = -1,
+    ) -> List["File"]:
+        """
+        Create multiple files in the virtual file system within a single transaction.
+        Either all files are created or none of them.
+        :param file_system: The file system.
+        :param paths: Pairs of the path in the virtual file system and the path of the real file on disk.
+        :param chunk_size: The size of a chunk. Values < 0 will let the algorithm choose.
+        :return: The opened files. Each of them needs to be wrapped in a context manager!
+        """
 
-            if not file_handle:
-                exception = MatryoshkaException(status)
-                raise exception
+        files = []
+        real_paths = []
+        for virtual_path, real_path in paths:
+            files.append(File(file_system, virtual_path))
+            real_paths.append(File._encode_real_path(real_path))
+        if not files:
+            return files
+
+        num_files = len(files)
+        file_handles = (File.HANDLE_TYPE * num_files)()
+        status_handle = Status.HANDLE_TYPE()
+        if not File._push_batch(
+            file_system.handle,
+            (ctypes.c_char_p * num_files)(*(file._path_bytes for file in files)),
+            (ctypes.c_char_p * num_files)(*real_paths),
+            num_files,
+            chunk_size,
+            ctypes.byref(status_handle),
+            file_handles,
+        ):
+            raise MatryoshkaException.from_handle(file_system.matryoshka, status_handle)
 
-            return File(file_system, virtual_path, file_handle)
+        for file, file_handle in zip(files, file_handles):
+            file.handle = file_handle
+            file._is_open = True
+        return files
 
     @classmethod
-    def find(cls, file_system: FileSystem, virtual_path: Path) -> Sequence["File"]:
+    def find(
+        cls, file_system: FileSystem, virtual_path: VIRTUAL_PATH_TYPE
+    ) -> "FoundFiles":
         """
         Find all those file matching a glob pattern.
         :param file_system: The virtual file system.
         :param virtual_path: The path in the virtual file system which may contain glob-like expression.
-        :return: A file which is not opened.
+        :return: The files found. They are not opened.
         """
 
-        file_system.matryoshka.library.Find.restype = File.HANDLE_TYPE
-        file_system.matryoshka.library.Find.argtypes = (
-            FileSystem.HANDLE_TYPE,
-            ctypes.c_char_p,
-            File.FIND_CALLBACK,
+        cls._ensure_initialized(file_system.matryoshka)
+        buffer = ctypes.POINTER(ctypes.c_char)()
+        buffer_size = ctypes.c_size_t()
+        num_paths = File._find_collect(
+            file_system.handle,
+            File._encode_virtual_path(virtual_path),
+            ctypes.byref(buffer),
+            ctypes.byref(buffer_size),
         )
+        if num_paths <= 0:
+            return FoundFiles(file_system, b"", 0)
 
-        paths = []
-
-        def add_path(file_name: bytes) -> None:
-            parts = file_name.decode(encoding="ascii").split("/")
-            paths.append(Path(*parts))
+        try:
+            raw_paths = ctypes.string_at(buffer, buffer_size.value)
+        finally:
+            File._destroy_buffer(buffer, buffer_size)
 
-        file_system.matryoshka.library.Find(
-            file_system.handle,
-            "/".join(virtual_path.parts).encode("ascii"),
-            File.FIND_CALLBACK(add_path),
-        )
-        return [cls(file_system, path) for path in paths]
+        return FoundFiles(file_system, raw_paths, num_paths)
 
     def __init__(
         self,
         file_system: FileSystem,
-        path: Path,
+        path: VIRTUAL_PATH_TYPE,
         existing_handle: Optional[HANDLE_TYPE] = None,
     ):
         """
         Create a new file. The file is not opened!
         :param file_system: The virtual file system.
-        :param path: The path to the virtual file.
+        :param path: The path to the virtual file. Strings need forward slashes as separators.
         :param existing_handle: An existing handle. If set, the instance will take ownership rather than open the file.
         """
         super().__init__(file_system.matryoshka)
-        self.path = path
+        self.path = path if isinstance(path, PurePath) else Path(path)
+        self._path_bytes = File._encode_virtual_path(path)
         self.file_system = file_system
-        self.handle = (
-            existing_handle if existing_handle is not None else File.HANDLE_TYPE()
-        )
+        if existing_handle is not None:
+            self.handle = existing_handle
+            self._is_open = bool(existing_handle)
+        else:
+            self.handle = File.HANDLE_TYPE()
+            self._is_open = False
+        self._size = None
+
+    @staticmethod
+    def _encode_virtual_path(path: VIRTUAL_PATH_TYPE) -> bytes:
+        if isinstance(path, str):
+            return path.encode("ascii")
+        return "/".join(path.parts).encode("ascii")
+
+    @staticmethod
+    def _encode_real_path(path: REAL_PATH_TYPE) -> bytes:
+        return os.fsencode(os.path.abspath(path))
 
     @classmethod
     def initialize(cls, matryoshka: Matryoshka):
-        matryoshka.library.Open.restype = File.HANDLE_TYPE
-        matryoshka.library.Open.argtypes = (
+        File._push = cls._declare(
+            matryoshka,
+            "Push",
+            File.HANDLE_TYPE,
             FileSystem.HANDLE_TYPE,
             ctypes.c_char_p,
+            ctypes.c_char_p,
+            ctypes.c_int,
             ctypes.POINTER(Status.HANDLE_TYPE),
         )
-
-        matryoshka.library.DestroyFileHandle.argtypes = (File.HANDLE_TYPE,)
-
-        matryoshka.library.Pull.restype = Status.HANDLE_TYPE
-        matryoshka.library.Pull.argtypes = (
+        File._push_batch = cls._declare(
+            matryoshka,
+            "PushBatch",
+            ctypes.c_int,
+            FileSystem.HANDLE_TYPE,
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.POINTER(Status.HANDLE_TYPE),
+            ctypes.POINTER(File.HANDLE_TYPE),
+        )
+        File._find_collect = cls._declare(
+            matryoshka,
+            "FindCollect",
+            ctypes.c_int,
             FileSystem.HANDLE_TYPE,
+            ctypes.c_char_p,
+            ctypes.POINTER(ctypes.POINTER(ctypes.c_char)),
+            ctypes.POINTER(ctypes.c_size_t),
+        )
+        File._destroy_buffer = cls._declare(
+            matryoshka,
+            "DestroyBuffer",
+            None,
+            ctypes.POINTER(ctypes.c_char),
+            ctypes.c_size_t,
+        )
+        File._open = cls._declare(
+            matryoshka,
+            "Open",
             File.HANDLE_TYPE,
+            FileSystem.HANDLE_TYPE,
             ctypes.c_char_p,
+            ctypes.POINTER(Status.HANDLE_TYPE),
+        )
+        File._pull = cls._declare(
+            matryoshka,
+            "Pull",
+            Status.HANDLE_TYPE,
+            FileSystem.HANDLE_TYPE,
+            File.HANDLE_TYPE,
+            ctypes.c_char_p,
+        )
+        File._get_size = cls._declare(
+            matryoshka,
+            "GetSize",
+            ctypes.c_int,
+            FileSystem.HANDLE_TYPE,
+            File.HANDLE_TYPE,
+        )
+        File._destroy = cls._declare(
+            matryoshka, "DestroyFileHandle", None, File.HANDLE_TYPE
         )
-
-        matryoshka.library.GetSize.restype = ctypes.c_int
-        matryoshka.library.GetSize.argtypes = (FileSystem.HANDLE_TYPE, File.HANDLE_TYPE)
 
     def __enter__(self):
-        if not self.handle:
-            with Status(self.file_system.matryoshka) as status:
-                self.handle = self.matryoshka.library.Open(
-                    self.file_system.handle,
-                    "/".join(self.path.parts).encode("ascii"),
-                    ctypes.byref(status.handle),
-                )
-                if not self.handle:
-                    self.handle = File.HANDLE_TYPE()
-                    raise MatryoshkaException(status)
+        if not self._is_open:
+            status_handle = Status.HANDLE_TYPE()
+            self.handle = File._open(
+                self.file_system.handle, self._path_bytes, ctypes.byref(status_handle)
+            )
+            if not self.handle:
+                self.handle = File.HANDLE_TYPE()
+                raise MatryoshkaException.from_handle(self.matryoshka, status_handle)
+            self._is_open = True
 
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.handle:
-            self.matryoshka.library.DestroyFileHandle(self.handle)
+        if self._is_open:
+            File._destroy(self.handle)
             self.handle = File.HANDLE_TYPE()
+            self._is_open = False
+            self._size = None
 
     def __bool__(self) -> bool:
-        return bool(self.handle)
+        return self._is_open
 
     def __str__(self) -> str:
-        return "/".join(self.path.parts)
+        return self._path_bytes.decode(encoding="ascii")
 
-    def pull(self, output_path: str) -> None:
+    def pull(self, output_path: REAL_PATH_TYPE) -> None:
         """
         Write a file into the real file system
         :param output_path: The output path on the real file system.
         """
 
-        if not self:
+        if not self._is_open:
             raise ValueError("The file is not open")
 
-        with Status(
-            self.matryoshka,
-            self.matryoshka.library.Pull(
-                self.file_system.handle, self.handle, str(output_path).encode("ascii")
-            ),
-        ) as status:
-            if status:
-                raise MatryoshkaException(status)
+        status_handle = File._pull(
+            self.file_system.handle, self.handle, os.fsencode(output_path)
+        )
+        if status_handle:
+            raise MatryoshkaException.from_handle(self.matryoshka, status_handle)
 
     @property
     def size(self) -> int:
         """
         Query the size of the file in virtual file system.
+        The size is cached while the file is open as the content of stored files does not change.
         :return: The size of the file in bytes or a value < 0 on error.
         """
-        if not self:
+        if not self._is_open:
             raise ValueError("The file is not open")
 
-        return self.matryoshka.library.GetSize(self.file_system.handle, self.handle)
+        if self._size is None:
+            size = File._get_size(self.file_system.handle, self.handle)
+            if size < 0:
+                return size
+            self._size = size
+        return self._size
+
+
+class FoundFiles:
+    """
+    The files found in the virtual file system. The paths are kept as raw bytes and
+    the files are created not before iterating.
+    """
+
+    __slots__ = ("file_system", "_raw_paths", "_num_paths")
+
+    def __init__(self, file_system: FileSystem, raw_paths: bytes, num_paths: int):
+        """
+        Create a new collection of found files.
+        :param file_system: The virtual file system.
+        :param raw_paths: The NUL-terminated paths concatenated.
+        :param num_paths: The number of paths.
+        """
+        self.file_system = file_system
+        self._raw_paths = raw_paths
+        self._num_paths = num_paths
+
+    def __len__(self) -> int:
+        return self._num_paths
+
+    def __iter__(self) -> Iterator[File]:
+        start = 0
+        for _ in range(self._num_paths):
+            end = self._raw_paths.index(b"\0", start)
+            yield File(
+                self.file_system, self._raw_paths[start:end].decode(encoding="ascii")
+            )
+            start = end + 1
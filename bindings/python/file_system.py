@@ -11,6 +11,8 @@ class FileSystem(ApiElement):
     The entry point for accessing the file system in a SQlite database.
     """
 
+    __slots__ = ("path", "handle", "_is_open")
+
     class FileSystem(ctypes.Structure):
         pass
 
@@ -29,35 +31,39 @@ class FileSystem(ApiElement):
         super().__init__(matryoshka)
         self.path = path
         self.handle = FileSystem.HANDLE_TYPE()
+        self._is_open = False
 
     @classmethod
     def initialize(cls, matryoshka: Matryoshka):
-        matryoshka.library.Load.restype = FileSystem.HANDLE_TYPE
-        matryoshka.library.Load.argtypes = [
+        FileSystem._load = cls._declare(
+            matryoshka,
+            "Load",
+            FileSystem.HANDLE_TYPE,
             ctypes.c_char_p,
             ctypes.POINTER(Status.HANDLE_TYPE),
-        ]
-
-        matryoshka.library.DestroyFileSystem.argtypes = [
-            ctypes.POINTER(FileSystem.FileSystem)
-        ]
+        )
+        FileSystem._destroy = cls._declare(
+            matryoshka, "DestroyFileSystem", None, FileSystem.HANDLE_TYPE
+        )
 
     def __enter__(self):
-        if not self.handle:
-            with Status(self.matryoshka) as status:
-                self.handle = self.matryoshka.library.Load(
-                    self.path.encode("ascii"), ctypes.byref(status.handle)
-                )
-                if not self.handle:
-                    self.handle = Status.HANDLE_TYPE()
-                    raise MatryoshkaException(status)
+        if not self._is_open:
+            status_handle = Status.HANDLE_TYPE()
+            self.handle = FileSystem._load(
+                self.path.encode("ascii"), ctypes.byref(status_handle)
+            )
+            if not self.handle:
+                self.handle = FileSystem.HANDLE_TYPE()
+                raise MatryoshkaException.from_handle(self.matryoshka, status_handle)
+            self._is_open = True
 
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if bool(self):
-            self.matryoshka.library.DestroyFileSystem(self.handle)
+        if self._is_open:
+            FileSystem._destroy(self.handle)
             self.handle = FileSystem.HANDLE_TYPE()
+            self._is_open = False
 
     def __bool__(self):
-        return bool(self.handle)
+        return self._is_open
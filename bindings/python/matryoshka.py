@@ -1,3 +1,4 @@
+import os
 from typing import Optional
 
 from system import System
@@ -34,8 +35,9 @@ class Matryoshka:
         """
 
         system = System.identify()
+        file_name = system.dynamic_library_name(name)
         for path in system.dynamic_library_paths():
-            file = path / system.dynamic_library_name(name)
-            if file.is_file():
-                return str(file)
+            file = os.path.join(path, file_name)
+            if os.path.isfile(file):
+                return file
         return None
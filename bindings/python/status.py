@@ -10,6 +10,8 @@ class Status(ApiElement):
     A status reported by the shared library. Mostly for internal use.
     """
 
+    __slots__ = ("handle", "_is_valid")
+
     class Status(ctypes.Structure):
         pass
 
@@ -24,29 +26,37 @@ class Status(ApiElement):
         """
 
         super().__init__(matryoshka)
-        self.handle = handle if handle is not None else Status.HANDLE_TYPE()
+        if handle is not None:
+            self.handle = handle
+            self._is_valid = bool(handle)
+        else:
+            self.handle = Status.HANDLE_TYPE()
+            self._is_valid = False
 
     @classmethod
     def initialize(cls, matryoshka: Matryoshka):
-        matryoshka.library.GetMessage.argtypes = [Status.HANDLE_TYPE]
-        matryoshka.library.GetMessage.restype = ctypes.c_char_p
-
-        matryoshka.library.DestroyStatus.argtypes = [Status.HANDLE_TYPE]
+        Status._get_message = cls._declare(
+            matryoshka, "GetMessage", ctypes.c_char_p, Status.HANDLE_TYPE
+        )
+        Status._destroy = cls._declare(
+            matryoshka, "DestroyStatus", None, Status.HANDLE_TYPE
+        )
 
     def __str__(self) -> str:
-        if not self.handle:
+        if not self._is_valid:
             return "<Uninitialized>"
 
-        raw_str: bytes = self.matryoshka.library.GetMessage(self.handle)
+        raw_str: bytes = Status._get_message(self.handle)
         return raw_str.decode(encoding="ascii")
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.handle:
-            self.matryoshka.library.DestroyStatus(self.handle)
+        if self._is_valid:
+            Status._destroy(self.handle)
             self.handle = Status.HANDLE_TYPE()
+            self._is_valid = False
 
     def __bool__(self):
-        return bool(self.handle)
+        return self._is_valid
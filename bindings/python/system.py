@@ -1,5 +1,6 @@
 import platform
 from enum import Enum
+from functools import lru_cache
 import os
 from pathlib import Path
 from typing import Iterable, Union
@@ -16,44 +17,51 @@ class System(Enum):
     MacOS = "Darwin"
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def identify() -> "System":
         plt = platform.system()
-        for system in System:
-            if system.value == plt:
-                return system
-        raise OSError(f"Unsupported operation system '{plt}'")
+        try:
+            return _SYSTEMS_BY_NAME[plt]
+        except KeyError:
+            raise OSError(f"Unsupported operation system '{plt}'") from None
 
     def load(self, path: Union[Path, str]):
-        return ctypes.WinDLL(path) if self == System.Windows else ctypes.CDLL(path)
+        # The library uses the C calling convention on all systems. Unlike ctypes.PyDLL,
+        # ctypes.CDLL releases the GIL during each call so long-running calls such as
+        # Push or Pull do not block other Python threads.
+        return ctypes.CDLL(path)
 
+    @lru_cache(maxsize=None)
     def dynamic_library_name(self, name: str) -> str:
         return f"{self.dynamic_library_prefix()}{name}{self.dynamic_library_suffix()}"
 
     def dynamic_library_prefix(self) -> str:
-        return "" if self == System.Windows else "lib"
+        return _DYNAMIC_LIBRARY_PREFIXES[self]
 
     def dynamic_library_suffix(self) -> str:
-        if self == System.Windows:
-            return ".dll"
-        elif self == System.Linux:
-            return ".so"
-        elif self == System.MacOS:
-            return ".dylib"
-        else:
-            raise NotImplementedError("Unsupported OS")
+        return _DYNAMIC_LIBRARY_SUFFIXES[self]
 
     def dynamic_library_env(self) -> str:
-        if self == System.Windows:
-            return "PATH"
-        elif self == System.Linux:
-            return "LD_LIBRARY_PATH"
-        elif self == System.MacOS:
-            return "DYLD_LIBRARY_PATH"
-        else:
-            raise NotImplementedError("Unsupported OS")
-
-    def dynamic_library_paths(self) -> Iterable[Path]:
+        return _DYNAMIC_LIBRARY_ENVS[self]
+
+    def dynamic_library_paths(self) -> Iterable[str]:
         for path in os.environ[self.dynamic_library_env()].split(os.pathsep):
-            path = Path(path)
-            if path.is_dir():
-                yield path.absolute()
+            yield os.path.abspath(path)
+
+
+_SYSTEMS_BY_NAME = {system.value: system for system in System}
+_DYNAMIC_LIBRARY_PREFIXES = {
+    System.Windows: "",
+    System.Linux: "lib",
+    System.MacOS: "lib",
+}
+_DYNAMIC_LIBRARY_SUFFIXES = {
+    System.Windows: ".dll",
+    System.Linux: ".so",
+    System.MacOS: ".dylib",
+}
+_DYNAMIC_LIBRARY_ENVS = {
+    System.Windows: "PATH",
+    System.Linux: "LD_LIBRARY_PATH",
+    System.MacOS: "DYLD_LIBRARY_PATH",
+}
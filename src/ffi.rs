@@ -1,7 +1,8 @@
 #![allow(clippy::missing_safety_doc)] // Well, using C-pointers *is* unsafe...
 
-use std::convert::TryInto;
+use std::convert::{TryFrom, TryInto};
 use std::ffi::{CStr, CString};
+use std::io::{Read, Result as IoResult};
 use std::os::raw::{c_char, c_int};
 use std::ptr::{null, null_mut};
 
@@ -23,17 +24,21 @@ impl Environment {
         match body() {
             Ok(value) => Box::into_raw(Box::new(value)),
             Err(error) => {
-                if !self.0.is_null() {
-                    let status = Environment::create_status(&error);
-                    unsafe {
-                        std::ptr::write(self.0, status);
-                    }
-                }
+                self.report(&error);
                 null_mut()
             }
         }
     }
 
+    pub fn report<T: AsRef<str>>(&self, description: T) {
+        if !self.0.is_null() {
+            let status = Environment::create_status(description);
+            unsafe {
+                std::ptr::write(self.0, status);
+            }
+        }
+    }
+
     pub fn create_status<T: AsRef<str>>(description: T) -> *mut Status {
         let message = CString::new(description.as_ref()).expect("Found NULL");
         Box::into_raw(Box::new(Status(message)))
@@ -60,6 +65,27 @@ impl Environment {
     }
 }
 
+/// A file on the real file system which is not opened before it is read.
+struct LocalFile<'a> {
+    path: &'a str,
+    file: Option<std::fs::File>,
+}
+
+impl<'a> From<&'a str> for LocalFile<'a> {
+    fn from(path: &'a str) -> Self {
+        Self { path, file: None }
+    }
+}
+
+impl<'a> Read for LocalFile<'a> {
+    fn read(&mut self, buf: &mut [u8]) -> IoResult<usize> {
+        if self.file.is_none() {
+            self.file = Some(std::fs::File::open(self.path)?);
+        }
+        self.file.as_mut().expect("File not opened").read(buf)
+    }
+}
+
 /// Then virtual file system.
 pub struct FileSystem(RawFileSystem<Database>);
 
@@ -199,6 +225,81 @@ pub unsafe extern "C" fn Push(
     })
 }
 
+/// Push multiple files to the virtual file system within a single transaction. Either all files are created or none.
+///
+/// @param file_system A pointer to the virtual file system.
+///
+/// @param inner_paths The inner paths on the virtual file system (mind the forward slashes as separators!)
+///
+/// @param file_paths The paths on the real file system in the same order as the inner paths.
+///
+/// @param count The number of files to push.
+///
+/// @param chunk_size The proposed chunk size. Negative values will let the virtual file system choose.
+///
+/// @param status Contains the error code of the failure if and only if the return value is 0. Setting this value to nullptr is safe and will not save the error code.
+///
+/// @param file_handles An array of at least count elements receiving the handles to the newly created files on success. Each of them needs to be freed.
+///
+/// @return 1 if operation was successful, 0 otherwise.
+#[no_mangle]
+pub unsafe extern "C" fn PushBatch(
+    file_system: *mut FileSystem,
+    inner_paths: *const *const c_char,
+    file_paths: *const *const c_char,
+    count: c_int,
+    chunk_size: c_int,
+    status: *mut *mut Status,
+    file_handles: *mut *mut FileHandle,
+) -> c_int {
+    let handles = (|| -> Result<Vec<RawHandle>, String> {
+        let file_system = file_system
+            .as_mut()
+            .ok_or_else(|| String::from("File system not specified"))?;
+        let count = usize::try_from(count).map_err(|_| String::from("Invalid number of files"))?;
+        if count == 0 {
+            return Ok(Vec::new());
+        }
+        if inner_paths.is_null() || file_paths.is_null() || file_handles.is_null() {
+            return Err(String::from("Paths not specified"));
+        }
+
+        let inner_paths = std::slice::from_raw_parts(inner_paths, count)
+            .iter()
+            .map(|inner_path| Environment::parse_str(*inner_path))
+            .collect::<Result<Vec<_>, _>>()?;
+        let local_files = std::slice::from_raw_parts(file_paths, count)
+            .iter()
+            .map(|file_path| Environment::parse_str(*file_path).map(LocalFile::from))
+            .collect::<Result<Vec<_>, _>>()?;
+
+        let chunk_size = std::cmp::max(0, chunk_size) as usize;
+        let files = File::create_all(
+            &mut file_system.0,
+            inner_paths.into_iter().zip(local_files.into_iter()),
+            chunk_size,
+        )
+        .map_err(|error| error.error_message())?;
+        Ok(files.iter().map(|file| file.handle()).collect())
+    })();
+
+    match handles {
+        Ok(handles) => {
+            for (index, handle) in handles.into_iter().enumerate() {
+                std::ptr::write(
+                    file_handles.add(index),
+                    Box::into_raw(Box::new(FileHandle(handle))),
+                );
+            }
+            1
+        }
+        Err(error) => {
+            Environment::from(status).report(error);
+            0
+        }
+    }
+}
+
 /// Pull a file from the database into the virtual file system.
 ///
 /// @param file_system A pointer to the virtual file system.
@@ -379,3 +480,74 @@ pub unsafe extern "C" fn Find(
 
     paths.len() as c_int
 }
+
+/// Search for a specific file(s) and collect all paths found in a single buffer.
+///
+/// @param file_system A pointer to the virtual file system.
+///
+/// @param path The path supporting glob-like placeholders.
+///
+/// @param buffer Contains the NUL-terminated paths found concatenated if the return value is > 0. It needs to be freed with DestroyBuffer.
+///
+/// @param buffer_size Contains the size of the buffer in bytes if the return value is > 0.
+///
+/// @return The number of paths found.
+#[no_mangle]
+pub unsafe extern "C" fn FindCollect(
+    file_system: *mut FileSystem,
+    path: *const c_char,
+    buffer: *mut *mut c_char,
+    buffer_size: *mut usize,
+) -> c_int {
+    if buffer.is_null() || buffer_size.is_null() {
+        return 0;
+    }
+
+    let file_system = match file_system.as_ref() {
+        Some(file_system) => file_system,
+        None => {
+            return 0;
+        }
+    };
+    let path = match Environment::parse_str(path) {
+        Ok(path) => path,
+        _ => {
+            return 0;
+        }
+    };
+
+    let paths = match file_system.0.find(path) {
+        Ok(paths) if !paths.is_empty() => paths,
+        _ => {
+            return 0;
+        }
+    };
+
+    let mut data: Vec<u8> = Vec::with_capacity(paths.iter().map(|path| path.len() + 1).sum());
+    for path in paths.iter() {
+        data.extend_from_slice(path.as_bytes());
+        data.push(0);
+    }
+
+    let data = data.into_boxed_slice();
+    std::ptr::write(buffer_size, data.len());
+    std::ptr::write(buffer, Box::into_raw(data) as *mut u8 as *mut c_char);
+
+    paths.len() as c_int
+}
+
+/// Destroy a buffer returned by the library.
+///
+/// @param buffer The buffer. Passing nullptr is a safe no-op.
+///
+/// @param buffer_size The size of the buffer as reported by the library.
+#[no_mangle]
+pub unsafe extern "C" fn DestroyBuffer(buffer: *mut c_char, buffer_size: usize) {
+    if buffer.is_null() {
+        return;
+    }
+    drop(Box::from_raw(std::ptr::slice_from_raw_parts_mut(
+        buffer as *mut u8,
+        buffer_size,
+    )));
+}
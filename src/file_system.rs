@@ -7,7 +7,7 @@ use std::io::{Error as IoError, ErrorKind, Read, Result as IoResult, Write};
 use rusqlite::limits::Limit;
 use rusqlite::{
     params, Connection as Database, DatabaseName, Error as RusqliteError, ErrorCode,
-    OptionalExtension,
+    OptionalExtension, Transaction,
 };
 
 use super::errors::{CreationError, DatabaseError, FileSystemError, LoadingError, ReadError};
@@ -151,68 +151,93 @@ where
     fn create<T: Into<VirtualPath>, R: Read>(
         &mut self,
         path: T,
-        mut data: R,
+        data: R,
         chunk_size: usize,
     ) -> Result<Handle, CreationError> {
+        let chunk_size = self.chunk_size(chunk_size);
+
+        // Create the transaction to return safely on errors.
+        let transaction = self.database.borrow_mut().transaction()?;
+        let handle = Self::insert(&transaction, path, data, chunk_size)?;
+        transaction.commit()?;
+        Ok(handle)
+    }
+
+    fn create_all<T: Into<VirtualPath>, R: Read, I: IntoIterator<Item = (T, R)>>(
+        &mut self,
+        files: I,
+        chunk_size: usize,
+    ) -> Result<Vec<Handle>, CreationError> {
+        let chunk_size = self.chunk_size(chunk_size);
+
+        // Insert all files within a single transaction: Either all files are created or none.
+        let transaction = self.database.borrow_mut().transaction()?;
+        let handles = files
+            .into_iter()
+            .map(|(path, data)| Self::insert(&transaction, path, data, chunk_size))
+            .collect::<Result<Vec<_>, _>>()?;
+        transaction.commit()?;
+        Ok(handles)
+    }
+
+    fn chunk_size(&self, chunk_size: usize) -> usize {
         let max_blob_size = self.database.borrow().limit(Limit::SQLITE_LIMIT_LENGTH);
-        let chunk_size = match chunk_size {
+        match chunk_size {
             value if value > 0 && value <= max_blob_size as usize => value,
             _ => constants::DEFAULT_BYTE_BLOB_SIZE,
-        };
+        }
+    }
 
-        // Create the transaction to return safely on errors and prepare the statement.
-        let transaction = self.database.borrow_mut().transaction()?;
+    fn insert<T: Into<VirtualPath>, R: Read>(
+        transaction: &Transaction,
+        path: T,
+        mut data: R,
+        chunk_size: usize,
+    ) -> Result<Handle, CreationError> {
+        let mut create_handle_statement =
+            transaction.prepare_cached(constants::SQL_CREATE_HANDLE)?;
+        let mut create_blob_statement = transaction.prepare_cached(constants::SQL_CREATE_BLOB)?;
+
+        let handle = match create_handle_statement.insert(params![
+            path.into().as_ref(),
+            constants::FILE_ID,
+            chunk_size as i32
+        ]) {
+            Ok(handle) => handle,
+            Err(RusqliteError::SqliteFailure(error, _))
+                if error.code == ErrorCode::ConstraintViolation =>
+            {
+                return Err(CreationError::FileExists);
+            }
+            Err(error) => {
+                return Err(error.into());
+            }
+        };
 
-        let handle = {
-            let mut create_handle_statement =
-                transaction.prepare_cached(constants::SQL_CREATE_HANDLE)?;
-            let mut create_blob_statement =
-                transaction.prepare_cached(constants::SQL_CREATE_BLOB)?;
-
-            let handle = match create_handle_statement.insert(params![
-                path.into().as_ref(),
-                constants::FILE_ID,
-                chunk_size as i32
-            ]) {
-                Ok(handle) => handle,
-                Err(RusqliteError::SqliteFailure(error, _))
-                    if error.code == ErrorCode::ConstraintViolation =>
-                {
-                    return Err(CreationError::FileExists);
+        let mut buffer = vec![0u8; chunk_size as usize];
+        let mut chunk_index = 0u32;
+        loop {
+            match data.read(buffer.as_mut()) {
+                Ok(size) => {
+                    create_blob_statement.execute(params![
+                        handle,
+                        chunk_index,
+                        &buffer[0..size]
+                    ])?;
+                    if size != chunk_size {
+                        break;
+                    }
+                    chunk_index += 1;
+                }
+                Err(error) if error.kind() == ErrorKind::Interrupted => {
+                    // Just try again...
                 }
                 Err(error) => {
                     return Err(error.into());
                 }
-            };
-
-            let mut buffer = vec![0u8; chunk_size as usize];
-            let mut chunk_index = 0u32;
-            loop {
-                match data.read(buffer.as_mut()) {
-                    Ok(size) => {
-                        create_blob_statement.execute(params![
-                            handle,
-                            chunk_index,
-                            &buffer[0..size]
-                        ])?;
-                        if size != chunk_size {
-                            break;
-                        }
-                        chunk_index += 1;
-                    }
-                    Err(error) if error.kind() == ErrorKind::Interrupted => {
-                        // Just try again...
-                    }
-                    Err(error) => {
-                        return Err(error.into());
-                    }
-                }
             }
+        }
 
-            handle
-        };
-
-        transaction.commit()?;
         Ok(Handle(handle))
     }
 
@@ -382,6 +407,38 @@ where
         })
     }
 
+    /// Create multiple files in the virtual file system within a single transaction.
+    ///
+    /// If the creation of any file fails, none of the files is created.
+    pub fn create_all<T: AsRef<str>, R: Read, I: IntoIterator<Item = (T, R)>>(
+        file_system: &'a mut FileSystem<D>,
+        files: I,
+        chunk_size: usize,
+    ) -> Result<Vec<File<'a, D>>, CreationError> {
+        let handles = file_system.create_all(
+            files
+                .into_iter()
+                .map(|(path, data)| (VirtualPath::from(path.as_ref()), data)),
+            chunk_size,
+        )?;
+        let file_system: &'a FileSystem<D> = file_system;
+        handles
+            .into_iter()
+            .map(|handle| {
+                let size = file_system
+                    .size(handle)
+                    .map_err(CreationError::DatabaseError)?
+                    .expect("Missing file size for existing file");
+                Ok(File {
+                    file_system,
+                    handle,
+                    size,
+                    current_index: 0,
+                })
+            })
+            .collect()
+    }
+
     /// Load a file from the virtual file system.
     pub fn load<T: AsRef<str>>(
         file_system: &'a FileSystem<D>,
@@ -772,4 +829,40 @@ mod tests {
         // Check general wildcard
         assert_eq!(file_system.find("*").expect("Finding failed").len(), 5);
     }
+
+    #[test]
+    fn test_create_all() {
+        let mut file_system = FileSystem::load(
+            Database::open_in_memory().expect("Open in-memory database failed"),
+            true,
+        )
+        .expect("Creating filesystem failed");
+        let data = [1u8, 2, 3];
+
+        // Create multiple files at once
+        let files = File::create_all(
+            &mut file_system,
+            vec![("folder/file1", &data[..]), ("folder/file2", &data[1..])],
+            2,
+        )
+        .expect("Creating files failed");
+        assert_eq!(files.len(), 2);
+        assert_eq!(files[0].len(), 3);
+        assert_eq!(files[1].len(), 2);
+
+        // Check that no file is created if any of them fails
+        assert_eq!(
+            File::create_all(
+                &mut file_system,
+                vec![("folder/file3", &data[..]), ("folder/file1", &data[..])],
+                2,
+            )
+            .expect_err("File created despite existent"),
+            CreationError::FileExists
+        );
+        assert_eq!(
+            File::load(&file_system, "folder/file3").expect_err("Rolled back file found"),
+            LoadingError::FileNotFound
+        );
+    }
 }
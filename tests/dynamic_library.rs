@@ -93,3 +93,56 @@ fn test_io(inner_path: &str, data: &[u8], chunk_size: i32) {
         assert_eq!(unsafe { matryoshka::Delete(file_system, file_handle) }, 0);
     }
 }
+
+#[test]
+fn test_find_collect() {
+    let database_path = CString::new(":memory:").expect("Valid database path");
+    let file_system = unsafe { matryoshka::Load(database_path.as_ptr(), null_mut()) };
+    assert!(!file_system.is_null());
+
+    let tmp_dir = tempfile::TempDir::new().expect("Unable to create temporary directory");
+    let mut input_path = tmp_dir.path().to_path_buf();
+    input_path.push("input.file");
+    std::fs::File::create(input_path.as_path()).expect("Creating input file failed");
+    let input_file_path =
+        CString::new(input_path.to_str().expect("Invalid TMP path")).expect("NULL in path");
+
+    for inner_path in ["folder1/file", "folder2/file", "other/file"].iter() {
+        let inner_path = CString::new(*inner_path).expect("Valid inner path");
+        let file_handle = unsafe {
+            matryoshka::Push(
+                file_system,
+                inner_path.as_ptr(),
+                input_file_path.as_ptr(),
+                -1,
+                null_mut(),
+            )
+        };
+        assert!(!file_handle.is_null(), "Push failed");
+        unsafe {
+            matryoshka::DestroyFileHandle(file_handle);
+        }
+    }
+
+    let pattern = CString::new("folder*/file").expect("Valid pattern");
+    let mut buffer = null_mut();
+    let mut buffer_size = 0usize;
+    let num_paths = unsafe {
+        matryoshka::FindCollect(file_system, pattern.as_ptr(), &mut buffer, &mut buffer_size)
+    };
+    assert_eq!(num_paths, 2);
+    assert!(!buffer.is_null());
+
+    let mut paths: Vec<&[u8]> =
+        unsafe { std::slice::from_raw_parts(buffer as *const u8, buffer_size) }
+            .split(|byte| *byte == 0)
+            .filter(|path| !path.is_empty())
+            .collect();
+    paths.sort();
+    assert_eq!(paths, vec![&b"folder1/file"[..], &b"folder2/file"[..]]);
+
+    unsafe {
+        matryoshka::DestroyBuffer(buffer, buffer_size);
+        matryoshka::DestroyFileSystem(file_system);
+    }
+}